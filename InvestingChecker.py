@@ -1,30 +1,377 @@
-import requests
+import argparse
+import functools
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Protocol
 
-def get_current_price(ticker, api_key="API KEY HERE"):
+import httpx
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; the stdlib parser also accepts raw bytes.
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj).encode("utf-8")
+
+try:
+    import redis
+except ImportError:  # Redis is only needed for the shared cross-process cache.
+    redis = None
+
+# The FMP API key is read once from the environment; the fetchers also accept an api_key
+# argument that overrides it for a single call.
+_API_KEY = os.environ.get("FMP_API_KEY", "")
+FMP_HOST = "financialmodelingprep.com"
+_QUOTE_BASE = f"https://{FMP_HOST}/api/v3/quote/"
+_INCOME_BASE = f"https://{FMP_HOST}/api/v3/income-statement/"
+_QUOTE_SUFFIX = f"?apikey={_API_KEY}"
+_INCOME_SUFFIX = f"?limit=2&apikey={_API_KEY}"
+
+MAX_WORKERS = 8  # Concurrent FMP requests; also the client's connection limit.
+
+# Transient failures (429 and 5xx gateway errors) are retried with exponential backoff,
+# honouring Retry-After up to MAX_RETRY_DELAY seconds; the transport itself retries
+# failed connection attempts.
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+MAX_RETRY_DELAY = 10.0
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Shared HTTP/2 client: the quote and income-statement requests are multiplexed as
+# concurrent streams over one keep-alive TCP/TLS connection to financialmodelingprep.com.
+_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=MAX_RETRIES,
+        limits=httpx.Limits(max_connections=MAX_WORKERS, max_keepalive_connections=4),
+    ),
+    timeout=httpx.Timeout(10.0, connect=3.05),
+    # Ask for compressed payloads explicitly so the income statements stay small on the wire.
+    headers={"Accept-Encoding": "gzip, deflate"},
+)
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "investingchecker")
+
+class Cache(Protocol):
+    """
+    Minimal interface shared by the cache backends: raw bytes in, raw bytes out.
+    """
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def setex(self, key: str, ttl: int, value: bytes) -> None: ...
+
+class FileCache:
+    """
+    Small on-disk cache for API responses, private to this machine.
+
+    Each entry is stored as {"ts": epoch, "ttl": seconds, "data": ...} in
+    <root>/<key prefix>/<md5 of last key part>.json, e.g. fmp:quote:AAPL is stored under
+    <root>/fmp/quote/. Entries are treated as missing once they are older than their ttl.
+    """
+
+    def __init__(self, root=CACHE_DIR):
+        self.root = root
+
+    def _path(self, key):
+        prefix, _, name = key.rpartition(":")
+        filename = hashlib.md5(name.encode("utf-8")).hexdigest() + ".json"
+        return os.path.join(self.root, *prefix.split(":"), filename)
+
+    def get(self, key):
+        """Return the cached value, or None if the entry is missing, unreadable or expired."""
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+            if time.time() - entry["ts"] < entry["ttl"]:
+                return entry["data"].encode("utf-8")
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+        return None
+
+    def setex(self, key, ttl, value):
+        """Store value atomically so concurrent readers never see a half-written file."""
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"ts": time.time(), "ttl": ttl, "data": value.decode("utf-8")}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # Caching is best-effort; a failed write just means a refetch next time.
+
+class RedisCache:
+    """
+    Cache backed by Redis, so several processes share one set of FMP responses.
+    Redis expires the keys itself via SETEX.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, key):
+        try:
+            return self.client.get(key)
+        except redis.RedisError:
+            return None  # Treat an unavailable server as a cache miss.
+
+    def setex(self, key, ttl, value):
+        try:
+            self.client.setex(key, ttl, value)
+        except redis.RedisError:
+            pass
+
+def _make_cache():
+    """
+    Use Redis when REDIS_URL is set and the server answers a ping; otherwise fall back to
+    the file cache.
+    """
+    redis_url = os.environ.get("REDIS_URL")
+    if redis_url and redis is not None:
+        try:
+            client = redis.Redis.from_url(redis_url, socket_timeout=1)
+            client.ping()
+            return RedisCache(client)
+        except (redis.RedisError, ValueError) as e:  # ValueError: malformed URL.
+            _log(f"Redis cache unavailable ({e}); using the file cache.")
+    return FileCache()
+
+# Created on first use, so importing the module never pings Redis.
+_CACHE: Optional[Cache] = None
+_CACHE_LOCK = threading.Lock()
+
+def _get_cache():
+    global _CACHE
+    if _CACHE is None:
+        with _CACHE_LOCK:  # Worker threads may race for the first lookup.
+            if _CACHE is None:
+                _CACHE = _make_cache()
+    return _CACHE
+
+QUOTE_TTL = 60
+INCOME_TTL = 24 * 3600
+QUOTE_BATCH_SIZE = 20  # Tickers per /quote request; keeps the comma-separated URL short.
+
+def _cache_get(endpoint, ticker):
+    value = _get_cache().get(f"fmp:{endpoint}:{ticker}")
+    return None if value is None else _json_loads(value)
+
+def _cache_set(endpoint, ticker, data, ttl):
+    _get_cache().setex(f"fmp:{endpoint}:{ticker}", ttl, _json_dumps(data))
+
+def cached(endpoint, ttl):
+    """
+    Cache the JSON payload returned by an FMP fetch function for ttl seconds under the
+    key fmp:<endpoint>:<ticker>. Only non-empty lists are cached; an empty result or an
+    error body (FMP sends those as a JSON object, sometimes with status 200) is refetched
+    on the next run.
+    """
+    def decorator(fetch):
+        @functools.wraps(fetch)
+        def wrapper(ticker, api_key):
+            data = _cache_get(endpoint, ticker)
+            if data is None:
+                data = fetch(ticker, api_key)
+                if isinstance(data, list) and data:
+                    _cache_set(endpoint, ticker, data, ttl)
+            return data
+        return wrapper
+    return decorator
+
+def _log(message):
+    """
+    Write one status line with a single write call, so lines from the fetcher threads
+    never interleave mid-line.
+    """
+    sys.stdout.write(message + "\n")
+
+def _write_lines(lines):
+    """Write the buffered lines to stdout in a single call and empty the buffer."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
+def _retry_delay(response, attempt):
+    """Seconds to wait before the next attempt: Retry-After if given, else exponential backoff."""
+    try:
+        return max(0.0, float(response.headers["Retry-After"]))
+    except (KeyError, ValueError):  # Missing, or an HTTP-date instead of seconds.
+        return BACKOFF_FACTOR * (2 ** attempt)
+
+def _get_json(url):
+    """
+    GET url on the shared client and return the parsed JSON body.
+
+    Rate limits and gateway errors are retried up to MAX_RETRIES times, unless the server
+    asks us to wait longer than MAX_RETRY_DELAY. The status code is
+    checked directly instead of going through raise_for_status(): any error status that
+    is left returns None. So does a body that is not a JSON list, which is how FMP reports
+    errors such as an invalid API key, sometimes with status 200.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        response = _CLIENT.get(url)
+        if response.status_code not in _RETRY_STATUSES or attempt == MAX_RETRIES:
+            break
+        delay = _retry_delay(response, attempt)
+        if delay > MAX_RETRY_DELAY:
+            break
+        _log(f"FMP returned HTTP {response.status_code}; retrying in {delay:.1f}s.")
+        time.sleep(delay)
+    if response.status_code >= 400:
+        _log(f"FMP request failed with HTTP {response.status_code}.")
+        return None
+    data = _json_loads(response.content)
+    if not isinstance(data, list):
+        _log(f"Unexpected FMP response: {data}")
+        return None
+    return data
+
+def _warm_dns():
+    """
+    Resolve FMP_HOST on a background thread while the user answers the ticker prompt, so
+    the first request finds the answer in the resolver cache.
+    """
+    def resolve():
+        try:
+            socket.getaddrinfo(FMP_HOST, 443, type=socket.SOCK_STREAM)
+        except OSError:
+            pass  # The real request reports any resolution failure.
+    threading.Thread(target=resolve, daemon=True).start()
+
+def _fetch_quotes(tickers, api_key):
+    """
+    Return {symbol: quote_row} for the given tickers.
+
+    Fresh rows are served from the cache; the rest are fetched with one comma-separated
+    /quote request per QUOTE_BATCH_SIZE tickers and cached individually.
+    """
+    rows = {}
+    missing = []
+    for ticker in tickers:
+        row = _cache_get("quote", ticker)
+        if row is None:
+            missing.append(ticker)
+        else:
+            rows[ticker] = row
+    for start in range(0, len(missing), QUOTE_BATCH_SIZE):
+        chunk = missing[start:start + QUOTE_BATCH_SIZE]
+        url = _QUOTE_BASE + ",".join(chunk) + (_QUOTE_SUFFIX if api_key is None else f"?apikey={api_key}")
+        for row in _get_json(url) or ():
+            if not isinstance(row, dict) or "symbol" not in row:
+                raise ValueError(f"malformed quote row: {row!r}")
+            rows[row["symbol"]] = row
+            _cache_set("quote", row["symbol"], row, QUOTE_TTL)
+    return rows
+
+@cached(endpoint="income", ttl=INCOME_TTL)
+def _fetch_income_statements(ticker, api_key):
+    url = _INCOME_BASE + ticker + (_INCOME_SUFFIX if api_key is None else f"?limit=2&apikey={api_key}")
+    data = _get_json(url)
+    if not isinstance(data, list):
+        return None
+    if not all(isinstance(statement, dict) for statement in data):
+        raise ValueError("malformed income statement data")
+    # Each statement carries ~60 fields; keep only the two the score needs, so the rest
+    # is freed right away and never written to the cache.
+    return [{"revenue": statement.get("revenue"), "netIncome": statement.get("netIncome")} for statement in data]
+
+@dataclass(slots=True)
+class Quote:
+    """
+    Price and technical metrics for one ticker, parsed once from an FMP /quote row.
+    """
+    price: float
+    market_cap: float
+    day_high: float
+    day_low: float
+    avg50: float
+    avg200: float
+
+    @classmethod
+    def from_fmp(cls, row):
+        """
+        Validate and convert every numeric field once. Raises ValueError if a field is
+        missing, null or not a number.
+        """
+        try:
+            return cls(
+                price=float(row["price"]),
+                market_cap=float(row["marketCap"]),
+                day_high=float(row["dayHigh"]),
+                day_low=float(row["dayLow"]),
+                avg50=float(row["priceAvg50"]),
+                avg200=float(row["priceAvg200"]),
+            )
+        except KeyError as e:
+            raise ValueError(f"missing {e.args[0]}") from None
+        except TypeError:
+            raise ValueError("null or non-numeric field in quote") from None
+
+def get_current_prices(tickers, api_key=None):
+    """
+    Fetch the current stock price and key technical metrics for several tickers at once
+    using the Financial Modeling Prep batch quote endpoint (/quote/AAPL,MSFT,...).
+
+    Returns a dict mapping each ticker to its Quote. Tickers without data are left out.
+    """
+    try:
+        rows = _fetch_quotes(tickers, api_key)
+        prices = {}
+        for ticker in tickers:
+            stock_data = rows.get(ticker)
+            if not stock_data:
+                _log(f"No data returned for ticker {ticker}.")
+                continue
+            try:
+                prices[ticker] = Quote.from_fmp(stock_data)
+            except ValueError as e:
+                _log(f"Invalid quote data for {ticker}: {e}")
+        return prices
+    except (httpx.HTTPError, ValueError) as e:
+        _log(f"Error fetching data for {', '.join(tickers)}: {e}")
+        return {}
+
+def get_current_price(ticker, api_key=None):
     """
     Fetch the current stock price and key technical metrics using the Financial Modeling Prep API.
+    Returns a Quote, or None if no data is available.
+    """
+    return get_current_prices([ticker], api_key).get(ticker)
+
+def get_income_figures(ticker, api_key=None):
     """
-    url = f"https://financialmodelingprep.com/api/v3/quote/{ticker}?apikey={api_key}"
+    Return (revenue_latest, revenue_previous, net_income_latest) from the latest two income
+    statements, or None if fewer than two statements are available.
+    """
+    data = _fetch_income_statements(ticker, api_key)
+    if not data or len(data) < 2:
+        _log(f"Not enough income statement data available for {ticker}. Using neutral score (0.5).")
+        return None
+    latest = data[0]
+    previous = data[1]
+    return latest.get("revenue"), previous.get("revenue"), latest.get("netIncome")
+
+def _income_figures_or_none(ticker, api_key=None):
+    """get_income_figures(), logging fetch errors and returning None instead of raising."""
     try:
-        response = requests.get(url)
-        response.raise_for_status()  # Raise exception for HTTP errors.
-        data = response.json()
-        if not data:
-            print(f"No data returned for ticker {ticker}.")
-            return None
-        stock_data = data[0]
-        current_price = float(stock_data.get("price"))
-        market_cap = stock_data.get("marketCap")
-        day_high = stock_data.get("dayHigh")
-        day_low = stock_data.get("dayLow")
-        price_avg50 = stock_data.get("priceAvg50")
-        price_avg200 = stock_data.get("priceAvg200")
-        return current_price, market_cap, day_high, day_low, price_avg50, price_avg200
-    except Exception as e:
-        print(f"Error fetching data for {ticker}: {e}")
+        return get_income_figures(ticker, api_key)
+    except (httpx.HTTPError, ValueError) as e:
+        _log(f"Error fetching fundamental data for {ticker}: {e}")
         return None
 
-def get_fundamental_score(ticker, api_key="API KEY HERE"):
+def get_fundamental_score(ticker, api_key=None):
     """
     Fetch the latest two income statements from Financial Modeling Prep and compute a simple
     fundamental score based on revenue growth and profit margin.
@@ -34,43 +381,32 @@ def get_fundamental_score(ticker, api_key="API KEY HERE"):
 
     The score is normalized between 0 (poor fundamentals) and 1 (strong fundamentals).
     """
-    url = f"https://financialmodelingprep.com/api/v3/income-statement/{ticker}?limit=2&apikey={api_key}"
-    try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-        if not data or len(data) < 2:
-            print(f"Not enough income statement data available for {ticker}. Using neutral score (0.5).")
-            return 0.5  # Neutral score if not enough data
-        latest = data[0]
-        previous = data[1]
-        revenue_latest = latest.get("revenue")
-        revenue_previous = previous.get("revenue")
-        net_income_latest = latest.get("netIncome")
-
-        if not revenue_latest or not revenue_previous or revenue_previous == 0 or net_income_latest is None:
-            return 0.5
-
-        # Calculate revenue growth rate
-        revenue_growth = (revenue_latest - revenue_previous) / revenue_previous
+    figures = _income_figures_or_none(ticker, api_key)
+    if figures is None:
+        return 0.5  # Neutral score if not enough data; the reason has been logged.
+    revenue_latest, revenue_previous, net_income_latest = figures
+
+    if not revenue_latest or not revenue_previous or revenue_previous == 0 or net_income_latest is None:
+        return 0.5
 
-        # Calculate profit margin for the latest period
-        profit_margin = net_income_latest / revenue_latest if revenue_latest else 0
+    # Calculate revenue growth rate
+    revenue_growth = (revenue_latest - revenue_previous) / revenue_previous
 
-        # Normalize each metric between 0 and 1.
-        normalized_profit_margin = max(0, min(1, profit_margin))
-        normalized_revenue_growth = max(0, min(1, revenue_growth))
+    # Calculate profit margin for the latest period
+    profit_margin = net_income_latest / revenue_latest if revenue_latest else 0
 
-        # The fundamental score is the average of the two normalized metrics.
-        fundamental_score = (normalized_profit_margin + normalized_revenue_growth) / 2
+    # Normalize each metric between 0 and 1.
+    normalized_profit_margin = max(0, min(1, profit_margin))
+    normalized_revenue_growth = max(0, min(1, revenue_growth))
 
-        print(f"Fundamental Score for {ticker}: {fundamental_score:.2f} "
-              f"(Profit Margin: {profit_margin:.2f}, Revenue Growth: {revenue_growth:.2f})")
-        return fundamental_score
-    except Exception as e:
-        print(f"Error fetching fundamental data for {ticker}: {e}")
-        return 0.5
+    # The fundamental score is the average of the two normalized metrics.
+    fundamental_score = (normalized_profit_margin + normalized_revenue_growth) / 2
 
+    _log(f"Fundamental Score for {ticker}: {fundamental_score:.2f} "
+         f"(Profit Margin: {profit_margin:.2f}, Revenue Growth: {revenue_growth:.2f})")
+    return fundamental_score
+
+@functools.lru_cache(maxsize=1024)
 def calculate_technical_chance_of_winning(current_price, target_price, stop_loss):
     """
     Calculate the base chance of winning based solely on price distances.
@@ -81,16 +417,21 @@ def calculate_technical_chance_of_winning(current_price, target_price, stop_loss
         return 0.5
     return stop_loss_distance / (stop_loss_distance + target_distance)
 
-def calculate_composite_chance_of_winning(current_price, target_price, stop_loss, fundamental_score, w_tech=0.7, w_fund=0.3):
+@functools.lru_cache(maxsize=1024)
+def calculate_composite_chance_of_winning(current_price, target_price, stop_loss, fundamental_score, w_tech=0.7, w_fund=0.3,
+                                          technical_chance=None):
     """
     Combine the technical chance (based on price distances) with the fundamental score.
     We use a weighted average where w_tech and w_fund represent the weights
     for the technical and fundamental components respectively.
+    Pass technical_chance if it has already been calculated to avoid computing it again.
     """
-    technical_chance = calculate_technical_chance_of_winning(current_price, target_price, stop_loss)
+    if technical_chance is None:
+        technical_chance = calculate_technical_chance_of_winning(current_price, target_price, stop_loss)
     composite_chance = w_tech * technical_chance + w_fund * fundamental_score
     return composite_chance
 
+@functools.lru_cache(maxsize=1024)
 def calculate_expectancy(current_price, target_price, stop_loss, chance_of_winning):
     """
     Calculate the trade expectancy.
@@ -99,6 +440,16 @@ def calculate_expectancy(current_price, target_price, stop_loss, chance_of_winni
     """
     return chance_of_winning * (target_price - current_price) - (1 - chance_of_winning) * (current_price - stop_loss)
 
+# Decision table indexed by the sign (-1, 0, +1) of the composite chance and of the expectancy
+# relative to their thresholds, each shifted by one. Only both above is a Buy and only both
+# below is a Sell; a 0 sign means "not comparable" (equal expectancy, or NaN).
+_DECISIONS = (
+    ("Sell", "Hold", "Hold"),
+    ("Hold", "Hold", "Hold"),
+    ("Hold", "Hold", "Buy"),
+)
+
+@functools.lru_cache(maxsize=1024)
 def final_decision(composite_chance, expectancy, chance_threshold=0.55, expectancy_threshold=0):
     """
     Make a final buy/sell/hold decision based on the composite chance and expectancy.
@@ -111,98 +462,284 @@ def final_decision(composite_chance, expectancy, chance_threshold=0.55, expectan
 
     You can adjust the thresholds to suit your risk tolerance and backtesting results.
     """
-    if composite_chance >= chance_threshold and expectancy > expectancy_threshold:
-        return "Buy"
-    elif composite_chance < chance_threshold and expectancy < expectancy_threshold:
-        return "Sell"
-    else:
-        return "Hold"
+    chance_sign = (composite_chance >= chance_threshold) - (composite_chance < chance_threshold)
+    expectancy_sign = (expectancy > expectancy_threshold) - (expectancy < expectancy_threshold)
+    return _DECISIONS[chance_sign + 1][expectancy_sign + 1]
+
+def _require_pandas():
+    """
+    Import numpy and pandas on first use. Only the portfolio path needs them, so the
+    interactive single-ticker path does not pay for their import time.
+    """
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        raise ImportError("Portfolio mode requires numpy and pandas: pip install numpy pandas") from None
+    return np, pd
 
-def evaluate_stock_for_trade(current_price, market_cap, day_high, day_low, price_avg50, price_avg200):
+def evaluate_batch(df, w_tech=0.7, w_fund=0.3, chance_threshold=0.55, expectancy_threshold=0):
     """
-    Evaluate whether to buy, hold, or sell based on technical indicators.
-    This function prints some technical signals based on moving averages and daily ranges.
+    Score many tickers at once with vectorized NumPy operations.
+
+    df has one row per ticker with the columns revenue_latest, revenue_previous,
+    net_income_latest, current_price, target_price and stop_loss. The result is a copy of
+    df with revenue_growth, profit_margin, fundamental_score, technical_chance,
+    composite_chance, expectancy and decision columns added, matching what
+    get_fundamental_score, calculate_composite_chance_of_winning, calculate_expectancy and
+    final_decision return for each row. A single ticker is just a one-row frame,
+    e.g. evaluate_batch(df.iloc[[0]]).
+    """
+    np, _ = _require_pandas()
+
+    revenue_latest = df["revenue_latest"].to_numpy(dtype=float)
+    revenue_previous = df["revenue_previous"].to_numpy(dtype=float)
+    net_income_latest = df["net_income_latest"].to_numpy(dtype=float)
+    current_price = df["current_price"].to_numpy(dtype=float)
+    target_price = df["target_price"].to_numpy(dtype=float)
+    stop_loss = df["stop_loss"].to_numpy(dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        revenue_growth = (revenue_latest - revenue_previous) / revenue_previous
+        profit_margin = net_income_latest / revenue_latest
+
+        # Rows with missing or zero revenue get the same neutral score as get_fundamental_score.
+        valid = (np.nan_to_num(revenue_latest) != 0) & (np.nan_to_num(revenue_previous) != 0) & ~np.isnan(net_income_latest)
+        fundamental_score = np.where(valid, (np.clip(profit_margin, 0, 1) + np.clip(revenue_growth, 0, 1)) / 2, 0.5)
+
+        stop_loss_distance = np.abs(current_price - stop_loss)
+        target_distance = np.abs(target_price - current_price)
+        total_distance = stop_loss_distance + target_distance
+        technical_chance = np.where(total_distance == 0, 0.5, stop_loss_distance / total_distance)
+
+    composite_chance = w_tech * technical_chance + w_fund * fundamental_score
+    expectancy = composite_chance * (target_price - current_price) - (1 - composite_chance) * (current_price - stop_loss)
+    chance_sign = (composite_chance >= chance_threshold).astype(int) - (composite_chance < chance_threshold)
+    expectancy_sign = (expectancy > expectancy_threshold).astype(int) - (expectancy < expectancy_threshold)
+    decision = np.array(_DECISIONS)[chance_sign + 1, expectancy_sign + 1]
+
+    return df.assign(
+        revenue_growth=np.where(valid, revenue_growth, np.nan),
+        profit_margin=np.where(valid, profit_margin, np.nan),
+        fundamental_score=fundamental_score,
+        technical_chance=technical_chance,
+        composite_chance=composite_chance,
+        expectancy=expectancy,
+        decision=decision,
+    )
+
+def evaluate_stock_for_trade(*, quote):
+    """
+    Evaluate whether to buy, hold, or sell based on the technical indicators in quote.
+    Returns (recommendation, out), where out lists the technical signals found in the
+    moving averages and daily range so the caller can print them together.
     """
     recommendation = "Hold"  # Default recommendation
+    out = []
 
     # Market Cap Analysis
-    if market_cap < 1000000000:
+    if quote.market_cap < 1000000000:
         recommendation = "Sell"
-        print(f"Market Cap: ${market_cap} (Small cap: consider selling)")
+        out.append(f"Market Cap: ${quote.market_cap:,.0f} (Small cap: consider selling)")
 
     # Moving Averages Analysis
-    if current_price > price_avg50:
-        print(f"Price is above the 50-day moving average ({price_avg50}). Bullish signal - up.")
+    if quote.price > quote.avg50:
+        out.append(f"Price is above the 50-day moving average ({quote.avg50}). Bullish signal - up.")
     else:
         recommendation = "Sell"
-        print(f"Price is below the 50-day moving average ({price_avg50}). Bearish signal - down.")
+        out.append(f"Price is below the 50-day moving average ({quote.avg50}). Bearish signal - down.")
 
-    if current_price > price_avg200:
-        print(f"Price is above the 200-day moving average ({price_avg200}). Long-term bullish trend - up.")
+    if quote.price > quote.avg200:
+        out.append(f"Price is above the 200-day moving average ({quote.avg200}). Long-term bullish trend - up.")
     else:
         recommendation = "Sell"
-        print(f"Price is below the 200-day moving average ({price_avg200}). Long-term bearish trend - down.")
+        out.append(f"Price is below the 200-day moving average ({quote.avg200}). Long-term bearish trend - down.")
 
     # Daily Range Analysis
-    if (day_high - day_low) != 0:
-        price_to_day_low_ratio = (current_price - day_low) / (day_high - day_low)
+    if (quote.day_high - quote.day_low) != 0:
+        price_to_day_low_ratio = (quote.price - quote.day_low) / (quote.day_high - quote.day_low)
     else:
         price_to_day_low_ratio = 0.5
     if price_to_day_low_ratio < 0.3:
-        print("Price is close to day's low. Potential buy signal.")
+        out.append("Price is close to day's low. Potential buy signal.")
         recommendation = "Buy"
     elif price_to_day_low_ratio > 0.7:
-        print("Price is close to day's high. Potential sell signal.")
+        out.append("Price is close to day's high. Potential sell signal.")
         recommendation = "Sell"
 
-    return recommendation
+    return recommendation, out
+
+def _fetch_with_quotes(tickers, fetch_one, api_key=None):
+    """
+    Run the batched quote request and fetch_one(ticker, api_key) for every ticker concurrently.
 
-def main():
-    print("=== Enhanced Trade Analysis Tool ===")
-    ticker = input("Enter the stock ticker symbol: ").upper().strip()
-    api_key = ""  # Replace with your API key if needed
+    Income statements can only be requested one ticker at a time, so each one runs in its
+    own worker alongside the batched quote request. All workers share the module-level
+    HTTP/2 client and its connection, so for N tickers the total wait is close to a single
+    round trip (bounded by MAX_WORKERS) instead of N of them.
+    Returns (quotes, results) as two dicts keyed by ticker.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        quotes_future = executor.submit(get_current_prices, tickers, api_key)
+        futures = {ticker: executor.submit(fetch_one, ticker, api_key) for ticker in tickers}
+        results = {ticker: future.result() for ticker, future in futures.items()}
+        return quotes_future.result(), results
 
-    # Fetch technical data
-    data = get_current_price(ticker, api_key)
-    if data is None:
-        print("Could not retrieve the financial data. Exiting.")
-        return
-    current_price, market_cap, day_high, day_low, price_avg50, price_avg200 = data
-    print(f"\nCurrent price for {ticker}: ${current_price:.2f}")
-    print(f"Market Cap: ${market_cap}")
-    print(f"Day High: ${day_high}, Day Low: ${day_low}")
-    print(f"50-Day Moving Average: ${price_avg50}")
-    print(f"200-Day Moving Average: ${price_avg200}")
+def fetch_market_data(tickers, api_key=None):
+    """
+    Fetch the quotes and the fundamental scores for the given tickers concurrently.
+    Returns (quotes, fundamental_scores) as two dicts keyed by ticker.
+    """
+    return _fetch_with_quotes(tickers, get_fundamental_score, api_key)
+
+def analyze_many(tickers, target_map, stop_map, api_key=None):
+    """
+    Analyze several tickers without any prompts.
+
+    Quotes come from the batched quote endpoint while the income statements are fetched in
+    parallel worker threads; the scoring then runs in a single evaluate_batch() pass.
+    target_map and stop_map map each ticker to its target price and stop-loss.
+    Returns the evaluate_batch() DataFrame indexed by ticker, with an extra
+    technical_recommendation column, or None if no quotes could be retrieved.
+    """
+    _, pd = _require_pandas()
+    quotes, figures = _fetch_with_quotes(tickers, _income_figures_or_none, api_key)
+
+    rows = []
+    for ticker in tickers:
+        quote = quotes.get(ticker)
+        if quote is None:
+            continue
+        revenue_latest, revenue_previous, net_income_latest = figures[ticker] or (None, None, None)
+        technical_recommendation, _ = evaluate_stock_for_trade(quote=quote)
+        rows.append({
+            "ticker": ticker,
+            "revenue_latest": revenue_latest,
+            "revenue_previous": revenue_previous,
+            "net_income_latest": net_income_latest,
+            "current_price": quote.price,
+            "target_price": target_map[ticker],
+            "stop_loss": stop_map[ticker],
+            "technical_recommendation": technical_recommendation,
+        })
+    if not rows:
+        return None
+    return evaluate_batch(pd.DataFrame(rows).set_index("ticker"))
 
-    # Fetch fundamental data and calculate a fundamental score.
-    fundamental_score = get_fundamental_score(ticker, api_key)
+def _ticker_list(value):
+    return [t.strip().upper() for t in value.split(",") if t.strip()]
 
+def _price_list(value):
     try:
-        target_price = float(input(f"\nEnter your target price for {ticker}: "))
-        stop_loss = float(input(f"Enter your stop-loss price for {ticker}: "))
+        return [float(v) for v in value.split(",")]
     except ValueError:
-        print("Invalid input for target price or stop-loss. Exiting.")
+        raise argparse.ArgumentTypeError(f"expected comma-separated prices, got {value!r}")
+
+def parse_args(argv=None):
+    """
+    Parse the command line. With no arguments on an interactive terminal the tool falls
+    back to prompting for its inputs.
+    """
+    parser = argparse.ArgumentParser(description="Enhanced trade analysis using the Financial Modeling Prep API.")
+    tickers_group = parser.add_mutually_exclusive_group()
+    tickers_group.add_argument("--ticker", type=str.upper, help="Single ticker to analyze, e.g. AAPL.")
+    tickers_group.add_argument("--tickers", type=_ticker_list, help="Comma-separated tickers to analyze in batch, e.g. AAPL,MSFT.")
+    parser.add_argument("--target", type=float, help="Target price for --ticker.")
+    parser.add_argument("--stop-loss", type=float, help="Stop-loss price for --ticker.")
+    parser.add_argument("--targets", type=_price_list, help="Comma-separated target prices, one per --tickers entry.")
+    parser.add_argument("--stop-losses", type=_price_list, help="Comma-separated stop-loss prices, one per --tickers entry.")
+    args = parser.parse_args(argv)
+
+    if (args.target is not None or args.stop_loss is not None) and args.ticker is None:
+        parser.error("--target and --stop-loss are only valid with --ticker")
+    if (args.target is None) != (args.stop_loss is None):
+        parser.error("--target and --stop-loss must be given together")
+    if args.tickers is not None:
+        if args.targets is None or args.stop_losses is None:
+            parser.error("--tickers requires --targets and --stop-losses")
+        if not len(args.tickers) == len(args.targets) == len(args.stop_losses):
+            parser.error("--tickers, --targets and --stop-losses must have the same number of entries")
+    elif args.targets is not None or args.stop_losses is not None:
+        parser.error("--targets and --stop-losses are only valid with --tickers")
+    elif not sys.stdin.isatty() and (args.ticker is None or args.target is None or args.stop_loss is None):
+        parser.error("without a terminal, pass --ticker/--target/--stop-loss or --tickers/--targets/--stop-losses")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # Output is collected in out and written in one go, flushed only before each prompt.
+    out = ["=== Enhanced Trade Analysis Tool ==="]
+    _write_lines(out)
+
+    if args.tickers is not None:
+        results = analyze_many(args.tickers, dict(zip(args.tickers, args.targets)), dict(zip(args.tickers, args.stop_losses)))
+        if results is None:
+            out.append("Could not retrieve the financial data. Exiting.")
+        else:
+            columns = ["current_price", "target_price", "stop_loss", "technical_chance", "fundamental_score",
+                       "composite_chance", "expectancy", "technical_recommendation", "decision"]
+            out.append(results[columns].to_string(float_format=lambda x: f"{x:.2f}"))
+        _write_lines(out)
         return
 
-    # Calculate the composite chance of winning and trade expectancy.
-    composite_chance = calculate_composite_chance_of_winning(current_price, target_price, stop_loss, fundamental_score)
-    expectancy = calculate_expectancy(current_price, target_price, stop_loss, composite_chance)
-
-    # We can use both technical indicators and our composite calculations.
-    tech_based_recommendation = evaluate_stock_for_trade(current_price, market_cap, day_high, day_low, price_avg50, price_avg200)
-    final_recommendation = final_decision(composite_chance, expectancy)
-
-    print("\n--- Trade Analysis ---")
-    print(f"Ticker:                      {ticker}")
-    print(f"Current Price:               ${current_price:.2f}")
-    print(f"Target Price:                ${target_price:.2f}")
-    print(f"Stop-Loss:                   ${stop_loss:.2f}")
-    print(f"Technical Chance:            {calculate_technical_chance_of_winning(current_price, target_price, stop_loss)*100:.1f}%")
-    print(f"Fundamental Score:           {fundamental_score*100:.1f}%")
-    print(f"Composite Chance:            {composite_chance*100:.1f}%")
-    print(f"Calculated Expectancy:       {expectancy:.2f}")
-    print(f"Technical Recommendation:    {tech_based_recommendation}")
-    print(f"Final Decision:              {final_recommendation}")
+    if args.ticker is not None:
+        tickers = [args.ticker]
+    else:
+        _warm_dns()  # Overlaps the lookup with the user typing the tickers.
+        tickers = _ticker_list(input("Enter the stock ticker symbol(s), comma-separated: "))
+
+    # Fetch technical data and the fundamental scores in parallel.
+    quotes, fundamental_scores = fetch_market_data(tickers)
+    if not quotes:
+        out.append("Could not retrieve the financial data. Exiting.")
+        _write_lines(out)
+        return
+
+    for ticker, quote in quotes.items():
+        fundamental_score = fundamental_scores[ticker]
+        current_price = quote.price
+        out.append(f"\nCurrent price for {ticker}: ${current_price:.2f}")
+        out.append(f"Market Cap: ${quote.market_cap:,.0f}")
+        out.append(f"Day High: ${quote.day_high}, Day Low: ${quote.day_low}")
+        out.append(f"50-Day Moving Average: ${quote.avg50}")
+        out.append(f"200-Day Moving Average: ${quote.avg200}")
+
+        _write_lines(out)
+        try:
+            if args.target is not None and args.stop_loss is not None:
+                target_price, stop_loss = args.target, args.stop_loss
+            else:
+                target_price = float(input(f"\nEnter your target price for {ticker}: "))
+                stop_loss = float(input(f"Enter your stop-loss price for {ticker}: "))
+        except ValueError:
+            out.append(f"Invalid input for target price or stop-loss. Skipping {ticker}.")
+            continue
+
+        # Calculate the composite chance of winning and trade expectancy.
+        technical_chance = calculate_technical_chance_of_winning(current_price, target_price, stop_loss)
+        composite_chance = calculate_composite_chance_of_winning(current_price, target_price, stop_loss, fundamental_score,
+                                                                 technical_chance=technical_chance)
+        expectancy = calculate_expectancy(current_price, target_price, stop_loss, composite_chance)
+
+        # We can use both technical indicators and our composite calculations.
+        tech_based_recommendation, signals = evaluate_stock_for_trade(quote=quote)
+        out.extend(signals)
+        final_recommendation = final_decision(composite_chance, expectancy)
+
+        out.append("\n--- Trade Analysis ---")
+        out.append(f"Ticker:                      {ticker}")
+        out.append(f"Current Price:               ${current_price:.2f}")
+        out.append(f"Target Price:                ${target_price:.2f}")
+        out.append(f"Stop-Loss:                   ${stop_loss:.2f}")
+        out.append(f"Technical Chance:            {technical_chance*100:.1f}%")
+        out.append(f"Fundamental Score:           {fundamental_score*100:.1f}%")
+        out.append(f"Composite Chance:            {composite_chance*100:.1f}%")
+        out.append(f"Calculated Expectancy:       {expectancy:.2f}")
+        out.append(f"Technical Recommendation:    {tech_based_recommendation}")
+        out.append(f"Final Decision:              {final_recommendation}")
+
+    _write_lines(out)
 
 if __name__ == '__main__':
     main()